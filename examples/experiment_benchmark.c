@@ -5,13 +5,21 @@
  * Implements experimental protocol from METHODOLOGY.md:
  * - N=1000 measurements per operation
  * - Warmup=100 iterations
- * - CLOCK_MONOTONIC timer (μs precision)
+ * - CLOCK_MONOTONIC_RAW timer (ns precision, not affected by NTP slew)
  * - Sequential and batched (2x) measurements
  * - Raw data saved to .dat files for statistical analysis
  *
  * Usage: ./experiment_benchmark <output_directory>
+ *        ./experiment_benchmark <M> <N> [--cache-bust]   (harness mode)
+ *
+ * Harness mode follows the contract of scripts/rigorous_benchmark.py
+ * (EXPERIMENTAL_METHODOLOGY.md, Algorithm 2.1): M untimed warmup
+ * iterations, then N timed KeyGen iterations, each printed as one line
+ * with an integer number of nanoseconds. All other output lines start
+ * with '#' and are ignored by the harness.
  */
 
+#include <errno.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdint.h>
@@ -28,14 +36,24 @@
 #define N_MEASUREMENTS 5000
 #define N_WARMUP 100
 
+// Monotonic timer without NTP frequency correction (Linux, macOS ≥ 10.12)
+#ifdef CLOCK_MONOTONIC_RAW
+#define BENCH_CLOCK CLOCK_MONOTONIC_RAW
+#define BENCH_CLOCK_NAME "CLOCK_MONOTONIC_RAW"
+#else
+#define BENCH_CLOCK CLOCK_MONOTONIC
+#define BENCH_CLOCK_NAME "CLOCK_MONOTONIC"
+#endif
+
 /**
- * Get current time in microseconds
- * Uses CLOCK_MONOTONIC per METHODOLOGY.md section 6.1.2
+ * Get current time in nanoseconds
+ * Integer arithmetic keeps full timer resolution (no double rounding
+ * of the absolute timestamp)
  */
-static inline double get_time_us(void) {
+static inline uint64_t get_time_ns(void) {
     struct timespec ts;
-    clock_gettime(CLOCK_MONOTONIC, &ts);
-    return (double)ts.tv_sec * 1000000.0 + (double)ts.tv_nsec / 1000.0;
+    clock_gettime(BENCH_CLOCK, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ULL + (uint64_t)ts.tv_nsec;
 }
 
 /**
@@ -52,7 +70,7 @@ static int save_measurements(const char* filepath, const double* data, int count
     fprintf(f, "# SABER GOST Performance Measurements\n");
     fprintf(f, "# Operation: %s\n", operation);
     fprintf(f, "# Measurements: N=%d, Warmup=%d\n", count, N_WARMUP);
-    fprintf(f, "# Timer: CLOCK_MONOTONIC\n");
+    fprintf(f, "# Timer: %s\n", BENCH_CLOCK_NAME);
     fprintf(f, "# Units: microseconds (μs)\n");
     fprintf(f, "#\n");
 
@@ -88,10 +106,10 @@ static int benchmark_operation(
     // Main measurements (section 6.2.2 - N = 1000)
     printf("    Measurements: %d iterations...\n", N_MEASUREMENTS);
     for (int i = 0; i < N_MEASUREMENTS; i++) {
-        double t_start = get_time_us();
+        uint64_t t_start = get_time_ns();
         operation();
-        double t_end = get_time_us();
-        measurements[i] = t_end - t_start;
+        uint64_t t_end = get_time_ns();
+        measurements[i] = (double)(t_end - t_start) / 1000.0;
 
         // Progress indicator every 100 iterations
         if ((i + 1) % 100 == 0) {
@@ -116,13 +134,98 @@ static int benchmark_operation(
     return 0;
 }
 
+// =============================================================================
+// Harness mode
+// =============================================================================
+
+// Key slots rotated under --cache-bust: 1024 × 2 key pairs (several MB)
+// do not fit in L2, so every iteration writes to cold lines
+#define HARNESS_SLOTS 1024
+
+static uint8_t harness_pk[HARNESS_SLOTS][2][SABER_PUBLIC_KEY_BYTES];
+static uint8_t harness_sk[HARNESS_SLOTS][2][SABER_SECRET_KEY_BYTES];
+
+/**
+ * Operation measured in harness mode
+ * Batching builds measure 2 × Saber_KeyGen, or saber_batch_keygen(2)
+ * when compiled with -DHARNESS_BATCHED
+ */
+static void harness_keygen(int slot) {
+#if defined(SABER_BATCHING_ENABLED) && defined(HARNESS_BATCHED)
+    saber_batch_keygen(harness_pk[slot], harness_sk[slot], 2);
+#elif defined(SABER_BATCHING_ENABLED)
+    Saber_KeyGen(harness_pk[slot][0], harness_sk[slot][0]);
+    Saber_KeyGen(harness_pk[slot][1], harness_sk[slot][1]);
+#else
+    Saber_KeyGen(harness_pk[slot][0], harness_sk[slot][0]);
+#endif
+}
+
+/**
+ * Parse a non-negative decimal count
+ * @return 0 on success, -1 if s is not a number
+ */
+static int parse_count(const char* s, long* value) {
+    char* end;
+    errno = 0;
+    *value = strtol(s, &end, 10);
+    return (errno != 0 || end == s || *end != '\0' || *value < 0) ? -1 : 0;
+}
+
+/**
+ * Harness mode: argv = [binary, M, N, (--cache-bust)]
+ */
+static int harness_main(long warmup, long iterations, int cache_bust) {
+#ifdef SABER_BATCHING_ENABLED
+    if (saber_batch_init() != 0) {
+        fprintf(stderr, "ERROR: Batching initialization failed (NEON not available?)\n");
+        return 1;
+    }
+#endif
+
+    printf("# timer: %s\n", BENCH_CLOCK_NAME);
+    if (cache_bust) {
+        // The harness relaxes Criterion 7.1 only after seeing this line
+        printf("# mode: cache-bust (%d key slots)\n", HARNESS_SLOTS);
+    }
+
+    // Warmup (section 6.2.1): same code path, not timed
+    for (long i = 0; i < warmup; i++) {
+        harness_keygen(cache_bust ? (int)(i % HARNESS_SLOTS) : 0);
+    }
+
+    // One integer line per timed iteration; printing happens outside
+    // the timed interval
+    for (long i = 0; i < iterations; i++) {
+        int slot = cache_bust ? (int)((warmup + i) % HARNESS_SLOTS) : 0;
+        uint64_t t_start = get_time_ns();
+        harness_keygen(slot);
+        uint64_t t_end = get_time_ns();
+        printf("%lld\n", (long long)(t_end - t_start));
+    }
+
+#ifdef SABER_BATCHING_ENABLED
+    saber_batch_cleanup();
+#endif
+    return fflush(stdout) == 0 ? 0 : 1;
+}
+
 /**
  * Main benchmark routine
  */
 int main(int argc, char* argv[]) {
+    // Harness mode: <M> <N> [--cache-bust]
+    long warmup, iterations;
+    if (argc >= 3 && parse_count(argv[1], &warmup) == 0
+            && parse_count(argv[2], &iterations) == 0) {
+        int cache_bust = argc > 3 && strcmp(argv[3], "--cache-bust") == 0;
+        return harness_main(warmup, iterations, cache_bust);
+    }
+
     // Check arguments
     if (argc < 2) {
         fprintf(stderr, "Usage: %s <output_directory>\n", argv[0]);
+        fprintf(stderr, "       %s <M> <N> [--cache-bust]   (harness mode)\n", argv[0]);
         fprintf(stderr, "\nExample:\n");
         fprintf(stderr, "  %s /root/saber_results/DEFAULT\n", argv[0]);
         return 1;
@@ -174,7 +277,7 @@ int main(int argc, char* argv[]) {
     printf("Methodology (METHODOLOGY.md section 6.2):\n");
     printf("  Measurements (N):   %d\n", N_MEASUREMENTS);
     printf("  Warmup (M):         %d\n", N_WARMUP);
-    printf("  Timer:              CLOCK_MONOTONIC\n");
+    printf("  Timer:              %s\n", BENCH_CLOCK_NAME);
     printf("  Output directory:   %s\n", output_dir);
     printf("\n");
     printf("════════════════════════════════════════════════════════════\n\n");
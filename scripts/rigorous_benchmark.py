@@ -2,125 +2,790 @@
 """
 Строгое бенчмаркирование SABER по разработанной методологии
 Следует протоколу из EXPERIMENTAL_METHODOLOGY.md
+
+Запуск с --demo проверяет методологию на синтетических данных без
+бинарников бенчмарков. Обязательная зависимость — только numpy;
+scipy и numba используются, если установлены.
 """
 
+import argparse
+import csv
+import glob
+import importlib.util
 import subprocess
-import statistics
 import math
+import multiprocessing
+import os
+import re
+import shlex
 import sys
-from typing import List, Tuple, Dict
-from dataclasses import dataclass
-from scipy import stats
-import numpy as np
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import cached_property, lru_cache
+from itertools import islice
+from statistics import NormalDist
+from typing import List, Optional, Tuple, Dict
+
+# numpy — единственная обязательная зависимость (scipy и numba опциональны)
+try:
+    import numpy as np
+except ImportError:
+    print("Ошибка: Требуется библиотека numpy")
+    print("Установка: pip3 install numpy")
+    sys.exit(1)
+
+# scipy нужен только для малых выборок и импортируется лениво:
+# при N >= 30 распределение Стьюдента заменяется нормальным
+_HAS_SCIPY = importlib.util.find_spec("scipy") is not None
+_NORMAL_APPROX_N = 30
+
+# Масштаб MAD до состоятельной оценки σ нормального распределения
+MAD_SCALE = 1.4826
+
+# Порог CV для критерия 7.1, %: обычный и для режима cache-bust
+CV_LIMIT = 10.0
+CV_LIMIT_CACHE_BUST = 20.0
+
+# Порог относительного размаха (max - min) / mean для критерия 7.5
+RELATIVE_RANGE_LIMIT = 0.30
+
+# Размах чистой нормальной выборки N ≤ 1000 почти никогда не превышает 9σ,
+# поэтому при большом разбросе порог поднимается до 9 робастных σ
+RANGE_LIMIT_SIGMAS = 9.0
+
+# Число замеров, после которых run_benchmark проверяет стабильность
+_STABILITY_CHECKPOINTS = (100, 250, 500)
+
+# Предельное время работы бинарника (warmup + все замеры), с
+BENCHMARK_TIMEOUT = 600
+
+# Строка замера в выводе бенчмарка: целое число наносекунд
+_NS_LINE_RE = re.compile(rb"^(\d+)\s*$", re.MULTILINE)
+
+# Строка, которой бинарник подтверждает режим --cache-bust
+_CACHE_BUST_BANNER = b"# mode: cache-bust"
+
+# Размер блока строк при чтении вывода бенчмарка
+_READ_BLOCK_LINES = 100
+
+# Поэлементный erfc для матриц p-value (в numpy его нет)
+_erfc = np.vectorize(math.erfc, otypes=[np.float64])
+
+
+@lru_cache(maxsize=128)
+def _t_quantile(confidence: float, df: int) -> float:
+    """
+    Двусторонний квантиль распределения Стьюдента (кэшируется по (confidence, df))
+    При df + 1 >= 30 или без scipy — квантиль нормального распределения
+    """
+    if df + 1 >= _NORMAL_APPROX_N or not _HAS_SCIPY:
+        return NormalDist().inv_cdf((1 + confidence) / 2)
+
+    from scipy.stats import t as student_t
+    return float(student_t.ppf((1 + confidence) / 2, df))
+
+
+def _range_limits(data: np.ndarray) -> np.ndarray:
+    """
+    Пороги относительного размаха по строкам буфера (k, N)
+    max(RELATIVE_RANGE_LIMIT, RANGE_LIMIT_SIGMAS · 1.4826 · MAD / median):
+    робастная σ не чувствительна к самому выбросу, который ищется
+    """
+    median = np.nanmedian(data, axis=1)
+    mad = np.nanmedian(np.abs(data - median[:, None]), axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        robust_cv = np.where(median > 0, MAD_SCALE * mad / median, 0.0)
+    return np.maximum(RELATIVE_RANGE_LIMIT, RANGE_LIMIT_SIGMAS * robust_cv)
+
+
+def _sweep_loops(data: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Статистики всех конфигураций одним проходом по буферу (k, N)
+    (второй проход по строке — только для дисперсии); NaN пропускаются.
+    Возвращает: (counts, means, stdevs, cvs, relative_errors, relative_ranges)
+    """
+    k, n = data.shape
+    counts = np.empty(k, dtype=np.int64)
+    means = np.empty(k)
+    stdevs = np.empty(k)
+    cvs = np.empty(k)
+    rel_errors = np.empty(k)
+    rel_ranges = np.empty(k)
+
+    for i in range(k):
+        count = 0
+        total = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for j in range(n):
+            x = data[i, j]
+            if x == x:  # не NaN
+                count += 1
+                total += x
+                lo = min(lo, x)
+                hi = max(hi, x)
+        mean = total / count if count > 0 else np.nan
+
+        var = 0.0
+        for j in range(n):
+            x = data[i, j]
+            if x == x:
+                d = x - mean
+                var += d * d
+        stdev = (var / (count - 1)) ** 0.5 if count > 1 else np.nan
+
+        counts[i] = count
+        means[i] = mean
+        stdevs[i] = stdev
+        if mean > 0:
+            cvs[i] = 100.0 * stdev / mean
+            rel_errors[i] = 100.0 * 1.96 * stdev / (count ** 0.5 * mean)
+            rel_ranges[i] = (hi - lo) / mean
+        else:
+            cvs[i] = 0.0
+            rel_errors[i] = 0.0
+            rel_ranges[i] = 0.0
+
+    return counts, means, stdevs, cvs, rel_errors, rel_ranges
+
+
+def _sweep_numpy(data: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """То же, что _sweep_loops, редукциями numpy по оси 1 (без numba)"""
+    counts = np.count_nonzero(~np.isnan(data), axis=1)
+    means = np.nanmean(data, axis=1)
+    stdevs = np.nanstd(data, axis=1, ddof=1)
+    spread = np.nanmax(data, axis=1) - np.nanmin(data, axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        positive = means > 0
+        cvs = np.where(positive, 100.0 * stdevs / means, 0.0)
+        rel_errors = np.where(positive,
+                              100.0 * 1.96 * stdevs / (np.sqrt(counts) * means),
+                              0.0)
+        rel_ranges = np.where(positive, spread / means, 0.0)
+
+    return counts, means, stdevs, cvs, rel_errors, rel_ranges
+
+
+# numba опционален и импортируется лениво: импорт и загрузка JIT-кэша
+# стоят ~0.3 с, а выигрыш ядра над numpy — ~10 μs на строку при N = 1000,
+# поэтому JIT окупается только на развертках из десятков тысяч конфигураций
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+_JIT_MIN_ROWS = 16384
+
+
+@lru_cache(maxsize=None)
+def _sweep_jit():
+    """_sweep_loops, скомпилированное numba (импорт при первом вызове)"""
+    from numba import njit
+
+    # fastmath без nnan — ядро опирается на NaN как маркер отброшенного замера
+    return njit(cache=True, fastmath={'reassoc', 'contract'})(_sweep_loops)
+
+
+def _sweep(data: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Статистики по строкам: ядро numba для больших буферов, иначе numpy"""
+    if _HAS_NUMBA and len(data) >= _JIT_MIN_ROWS:
+        return _sweep_jit()(data)
+    return _sweep_numpy(data)
+
+
+class Experiment:
+    """
+    Результаты всех конфигураций эксперимента в одном буфере (SoA)
+
+    data: массив (k, N) в микросекундах, строка — конфигурация.
+    NaN отмечает отброшенный замер, поэтому выборки разной длины
+    (после фильтрации выбросов) хранятся в том же непрерывном буфере.
+    Статистики всех строк вычисляются одним вызовом _sweep и кэшируются.
+    source: исходный эксперимент, из которого получен отфильтрованный;
+    размах, его порог и флаги aborted берутся по исходным данным (выброс,
+    указывающий на нестабильность, фильтр MAD удаляет первым).
+    aborted: (k,) bool — измерения прерваны run_benchmark как нестабильные
+    """
+
+    def __init__(self, keys: List[str], names: List[str], data: np.ndarray,
+                 source: Optional['Experiment'] = None,
+                 aborted: Optional[np.ndarray] = None):
+        self.keys = list(keys)
+        self.names = list(names)
+        self.data = np.asarray(data, dtype=np.float64)
+        self.source = source
+        if aborted is None:
+            aborted = np.zeros(len(self.data), dtype=bool)
+        self._aborted = np.asarray(aborted, dtype=bool)
+
+    @classmethod
+    def from_measurements(cls, measurements: Dict[str, np.ndarray],
+                          aborted: Optional[Dict[str, bool]] = None) -> 'Experiment':
+        """
+        Сборка буфера из отдельных серий (короткие дополняются NaN)
+        aborted: флаги прерванных серий по тем же ключам
+        """
+        n = max(len(m) for m in measurements.values())
+        data = np.full((len(measurements), n), np.nan)
+        for row, m in zip(data, measurements.values()):
+            row[:len(m)] = m
+        flags = None
+        if aborted is not None:
+            flags = [aborted.get(key, False) for key in measurements]
+        return cls(list(measurements), list(measurements), data, aborted=flags)
+
+    @property
+    def aborted(self) -> np.ndarray:
+        """Флаги конфигураций, измерения которых прерваны как нестабильные"""
+        if self.source is not None:
+            return self.source.aborted
+        return self._aborted
+
+    @cached_property
+    def _summary(self) -> Tuple[np.ndarray, ...]:
+        """Все статистики по строкам за один вызов _sweep"""
+        return _sweep(self.data)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Объем выборки каждой конфигурации"""
+        return self._summary[0]
+
+    @property
+    def means(self) -> np.ndarray:
+        """Выборочные средние"""
+        return self._summary[1]
+
+    @property
+    def stdevs(self) -> np.ndarray:
+        """Выборочные стандартные отклонения (несмещенные)"""
+        return self._summary[2]
+
+    @property
+    def cvs(self) -> np.ndarray:
+        """Коэффициенты вариации, %"""
+        return self._summary[3]
+
+    @property
+    def relative_errors(self) -> np.ndarray:
+        """Относительные погрешности среднего δ = 1.96·s / (√N·mean), %"""
+        return self._summary[4]
+
+    @property
+    def relative_ranges(self) -> np.ndarray:
+        """Относительные размахи (max - min) / mean исходных данных"""
+        if self.source is not None:
+            return self.source.relative_ranges
+        return self._summary[5]
+
+    @cached_property
+    def range_limits(self) -> np.ndarray:
+        """Пороги относительного размаха (см. _range_limits) исходных данных"""
+        if self.source is not None:
+            return self.source.range_limits
+        return _range_limits(self.data)
+
+    def remove_outliers(self, threshold=3.0) -> 'Experiment':
+        """
+        Удаление выбросов по медианному абсолютному отклонению (MAD)
+        threshold: количество робастных σ (σ ≈ 1.4826 · MAD)
+        """
+        deviation = np.abs(self.data - np.nanmedian(self.data, axis=1, keepdims=True))
+        mad = np.nanmedian(deviation, axis=1, keepdims=True)
+
+        # Фильтрация: |T_i - median| <= threshold * 1.4826 * MAD
+        # (при MAD = 0 более половины замеров совпадают — фильтровать нечего)
+        keep = (deviation <= threshold * MAD_SCALE * mad) | (mad == 0)
+        filtered = Experiment(self.keys,
+                              [name + " (filtered)" for name in self.names],
+                              np.where(keep, self.data, np.nan),
+                              source=self.source or self)
+
+        removed_pct = 100.0 * (self.counts - filtered.counts) / self.counts
+        for name, pct in zip(self.names, removed_pct):
+            if pct > 5.0:
+                print(f"ВНИМАНИЕ: Удалено {pct:.1f}% измерений для {name}")
+                print(f"Рекомендуется повторить эксперимент")
+
+        return filtered
+
+    def results(self) -> Dict[str, 'BenchmarkResult']:
+        """Представления конфигураций по ключам"""
+        return {key: BenchmarkResult(self, i) for i, key in enumerate(self.keys)}
+
 
-@dataclass
 class BenchmarkResult:
-    """Результаты измерений для одной конфигурации"""
-    name: str
-    measurements: List[float]  # в микросекундах
+    """
+    Результаты измерений для одной конфигурации
+    Тонкое представление строки общего буфера Experiment: статистики
+    берутся из уже вычисленных векторов эксперимента
+    """
+
+    def __init__(self, experiment: Experiment, index: int):
+        self._experiment = experiment
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._experiment.names[self._index]
+
+    @property
+    def measurements(self) -> np.ndarray:
+        """Оставшиеся замеры, μs"""
+        row = self._experiment.data[self._index]
+        return row[~np.isnan(row)]
+
+    @property
+    def n(self) -> int:
+        """Объем выборки"""
+        return int(self._experiment.counts[self._index])
 
     @property
     def mean(self) -> float:
         """Выборочное среднее"""
-        return statistics.mean(self.measurements)
+        return float(self._experiment.means[self._index])
 
     @property
     def stdev(self) -> float:
         """Выборочное стандартное отклонение (несмещенное)"""
-        return statistics.stdev(self.measurements)
+        return float(self._experiment.stdevs[self._index])
 
     @property
     def cv(self) -> float:
         """Коэффициент вариации, %"""
-        return 100.0 * self.stdev / self.mean if self.mean > 0 else 0.0
+        return float(self._experiment.cvs[self._index])
+
+    @property
+    def relative_error(self) -> float:
+        """Относительная погрешность среднего, %"""
+        return float(self._experiment.relative_errors[self._index])
+
+    @property
+    def relative_range(self) -> float:
+        """Относительный размах (max - min) / mean до фильтрации выбросов"""
+        return float(self._experiment.relative_ranges[self._index])
+
+    @property
+    def range_limit(self) -> float:
+        """Порог относительного размаха: max(30%, 9 робастных σ)"""
+        return float(self._experiment.range_limits[self._index])
+
+    @property
+    def aborted(self) -> bool:
+        """Измерения прерваны run_benchmark на контрольной точке"""
+        return bool(self._experiment.aborted[self._index])
+
+    @property
+    def stable(self) -> bool:
+        """
+        Стабильность конфигурации: измерения не прерваны и относительный
+        размах ниже порога
+        """
+        return not self.aborted and self.relative_range < self.range_limit
 
     def confidence_interval(self, confidence=0.95) -> Tuple[float, float]:
         """
         95% доверительный интервал для среднего
-        Использует распределение Стьюдента
+        Квантиль распределения Стьюдента при n < 30, при n >= 30 (или без
+        scipy) — нормального: при n = 30 интервал уже на ~4%, при n = 1000
+        разница ~0.1% (см. _t_quantile)
         """
-        n = len(self.measurements)
+        n = self.n
         if n < 2:
             return (self.mean, self.mean)
 
         # Квантиль распределения Стьюдента
-        t_value = stats.t.ppf((1 + confidence) / 2, n - 1)
+        t_value = _t_quantile(confidence, n - 1)
 
         # Полуширина интервала
         margin = t_value * self.stdev / math.sqrt(n)
 
         return (self.mean - margin, self.mean + margin)
 
-    def remove_outliers(self, threshold=3.0) -> 'BenchmarkResult':
-        """
-        Удаление выбросов (метод 3σ по Налимову)
-        threshold: количество стандартных отклонений
-        """
-        mean = self.mean
-        stdev = self.stdev
 
-        # Фильтрация: |T_i - mean| <= threshold * σ
-        filtered = [t for t in self.measurements
-                   if abs(t - mean) <= threshold * stdev]
+def _run_privileged(script: str) -> bool:
+    """Выполнение shell-команды от root (напрямую или через sudo без пароля)"""
+    cmd = ["sh", "-c", script]
+    if os.geteuid() != 0:
+        cmd = ["sudo", "-n"] + cmd
+
+    try:
+        returncode = subprocess.run(cmd,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL,
+                                    check=False).returncode
+    except OSError:
+        returncode = -1
+    return returncode == 0
+
+
+def drop_page_cache():
+    """
+    Сброс page cache ОС (только Linux, требует root или sudo без пароля)
+    Влияет только на данные, читаемые из файлов (входные векторы, сам
+    бинарник при первом запуске): кэши CPU и буферы в памяти процесса
+    он не затрагивает. Warmup внутри бинарника снова загружает эти файлы,
+    поэтому на замеры сброс влияет, только если файлы читаются в самом
+    измеряемом цикле; холодный кэш данных обеспечивает ротация буферов
+    в бинарнике (--cache-bust). Сброс глобальный и сам шумит (sync),
+    поэтому выполняется один раз до запуска конфигураций.
+    Ошибка не прерывает эксперимент: режим cache-bust становится
+    лишь частичным, о чем выводится предупреждение
+    """
+    if not _run_privileged("sync && echo 3 > /proc/sys/vm/drop_caches"):
+        print("  ВНИМАНИЕ: Не удалось сбросить page cache (нужен root/sudo)")
 
-        removed_count = len(self.measurements) - len(filtered)
-        removed_pct = 100.0 * removed_count / len(self.measurements)
 
-        if removed_pct > 5.0:
-            print(f"ВНИМАНИЕ: Удалено {removed_pct:.1f}% измерений для {self.name}")
-            print(f"Рекомендуется повторить эксперимент")
+# Настройки частоты CPU в sysfs: Turbo Boost (intel_pstate или
+# cpufreq/boost) и governor каждого ядра
+_CPU_SYSFS = "/sys/devices/system/cpu"
+_NO_TURBO = f"{_CPU_SYSFS}/intel_pstate/no_turbo"
+_BOOST = f"{_CPU_SYSFS}/cpufreq/boost"
 
-        return BenchmarkResult(
-            name=self.name + " (filtered)",
-            measurements=filtered
-        )
+
+def _read_cpu_frequency_settings() -> Dict[str, str]:
+    """Текущие значения настроек частоты CPU (путь sysfs -> значение)"""
+    paths = [_NO_TURBO, _BOOST] + sorted(
+        glob.glob(f"{_CPU_SYSFS}/cpu[0-9]*/cpufreq/scaling_governor"))
+    settings = {}
+    for path in paths:
+        try:
+            with open(path) as f:
+                settings[path] = f.read().strip()
+        except OSError:
+            pass
+    return settings
+
+
+def _write_sysfs(settings: Dict[str, str]) -> bool:
+    """Запись значений в sysfs одним привилегированным вызовом"""
+    script = "\n".join(f"echo {shlex.quote(value)} > {shlex.quote(path)}"
+                       for path, value in settings.items())
+    return bool(settings) and _run_privileged(script)
+
+
+@contextmanager
+def locked_cpu_frequency():
+    """
+    Фиксация частоты CPU на время блока with (только Linux, root/sudo):
+    Turbo Boost отключается, governor всех ядер — "performance"; на выходе
+    восстанавливаются исходные значения.
+    Троттлинг и Turbo Boost дают до ±5% шума; настройка глобальная,
+    поэтому выполняется один раз вокруг запуска всех конфигураций
+    """
+    saved = _read_cpu_frequency_settings()
+    locked = {path: "1" if path == _NO_TURBO else "0" if path == _BOOST
+              else "performance" for path in saved}
+    if not _write_sysfs(locked):
+        print("  ВНИМАНИЕ: Не удалось зафиксировать частоту CPU (нужен root/sudo)")
+        saved = {}
+
+    try:
+        yield
+    finally:
+        if saved and not _write_sysfs(saved):
+            print("  ВНИМАНИЕ: Не удалось восстановить настройки частоты CPU")
+
+
+def _stabilize_env(pid: int):
+    """
+    Перевод запущенного бинарника pid в SCHED_FIFO с приоритетом 1
+    (только Linux). Вызывающий процесс остается с обычным приоритетом:
+    иначе поток чтения pipe и watchdog на том же ядре не получили бы
+    процессор, пока бинарник считает (FIFO не делит время между равными
+    приоритетами)
+    """
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(pid, os.SCHED_FIFO, os.sched_param(1))
+        except PermissionError:
+            print("  ВНИМАНИЕ: SCHED_FIFO недоступен (нужен CAP_SYS_NICE)")
 
 
 def run_benchmark(binary_path: str, iterations: int = 1000,
-                  warmup: int = 100) -> List[float]:
+                  warmup: int = 100, cache_bust: bool = False,
+                  stable: bool = False, core: Optional[int] = None,
+                  verbose: bool = True) -> Tuple[np.ndarray, bool]:
     """
     Запуск бенчмарка по протоколу:
-    1. Warmup (прогрев кэша)
-    2. N измерений
-    3. Возврат массива времен
-    """
-    print(f"  Warmup ({warmup} итераций)...", end='', flush=True)
-
-    # Warmup
-    for _ in range(warmup):
-        subprocess.run([binary_path],
-                      stdout=subprocess.DEVNULL,
-                      stderr=subprocess.DEVNULL,
-                      check=True)
-
-    print(" ✓")
-    print(f"  Основные измерения ({iterations} итераций)...", end='', flush=True)
-
-    # Основные измерения
-    measurements = []
-    for i in range(iterations):
-        if (i + 1) % 100 == 0:
-            print(f"\r  Основные измерения ({i+1}/{iterations})...",
-                  end='', flush=True)
-
-        # Запуск и парсинг вывода
-        result = subprocess.run([binary_path],
-                               capture_output=True,
-                               text=True,
-                               check=True)
-
-        # Парсинг времени из вывода (ожидаем формат "KeyGen: XX.XX μs")
-        for line in result.stdout.splitlines():
-            if "KeyGen:" in line:
-                # Извлечение числа
-                parts = line.split()
-                time_str = parts[1]
-                time_us = float(time_str)
-                measurements.append(time_us)
-                break
-
-    print(" ✓")
-    return measurements
+    1. Один запуск бинарника на конфигурацию: argv = [binary, warmup, iterations]
+    2. Бинарник сам выполняет warmup итераций без замеров (прогрев кэша
+       и предсказателя переходов в том же процессе)
+    3. Затем выполняет iterations замеров по CLOCK_MONOTONIC_RAW
+       (mach_absolute_time на Darwin) и на каждый печатает в stdout одну
+       строку — целое число наносекунд; прочие строки игнорируются
+       (эталон — режим harness в examples/experiment_benchmark.c)
+    4. Возврат (массив времен в микросекундах, aborted)
+
+    Если после 100, 250 или 500 замеров относительный размах достигает
+    порога _range_limits, бинарник останавливается и возвращаются уже
+    собранные замеры с aborted = True: Experiment.from_measurements
+    сохраняет флаг, и конфигурация считается нестабильной.
+
+    cache_bust: измерение с холодным кэшем данных. Бинарник получает флаг
+    --cache-bust и на каждой итерации переключается между разными входными
+    буферами: код остается в кэше, данные — нет. Бинарник обязан
+    подтвердить режим строкой "# mode: cache-bust" до первого замера,
+    иначе RuntimeError: флаг, не понятый бинарником, не должен ослаблять
+    порог CV критерия 7.1. Page cache ОС здесь не сбрасывается: это
+    делает run_configurations один раз до запуска (см. drop_page_cache).
+
+    stable: сразу после запуска бинарник (но не вызывающий процесс)
+    переводится в SCHED_FIFO (см. _stabilize_env); частоту CPU фиксирует
+    locked_cpu_frequency.
+
+    core: сразу после запуска бинарник (но не вызывающий процесс)
+    закрепляется за этим ядром через sched_setaffinity(proc.pid); чтение
+    pipe и watchdog остаются на ядрах вызывающего процесса. Первые
+    инструкции бинарника могут выполниться до закрепления — их
+    поглощает warmup.
+
+    verbose: печатать прогресс (отключается при параллельном запуске)
+    """
+    argv = [str(warmup), str(iterations)]
+    if cache_bust:
+        argv.append("--cache-bust")
+    if verbose:
+        print(f"  Основные измерения ({iterations} итераций, "
+              f"warmup {warmup} в бинарнике)...", end='', flush=True)
+
+    # Запуск один раз на конфигурацию.
+    # Абсолютный executable и close_fds=False (без preexec_fn, cwd,
+    # start_new_session) позволяют CPython запустить процесс через
+    # posix_spawn вместо fork+exec (см. subprocess._USE_POSIX_SPAWN)
+    executable = os.path.abspath(binary_path)
+    proc = subprocess.Popen([executable] + argv,
+                            executable=executable,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
+                            bufsize=1 << 20,
+                            close_fds=False)
+
+    # Буфер на все замеры выделяется заранее; вывод читается блоками
+    # по _READ_BLOCK_LINES строк, каждый блок разбирается одним findall
+    measurements_ns = np.empty(iterations, dtype=np.int64)
+    count = 0
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(BENCHMARK_TIMEOUT, kill_on_timeout)
+
+    # Ранняя отбраковка: на контрольных точках по текущим min/max/sum
+    # проверяется относительный размах (Критерий 7.5); порог с учетом
+    # робастной σ считается, только если размах превысил 30%
+    checkpoints = [c for c in _STABILITY_CHECKPOINTS if c < iterations]
+    lo, hi, total = np.iinfo(np.int64).max, 0, 0
+    relative_range = 0.0
+    unstable = False
+    confirmed = not cache_bust
+
+    # Любая ошибка после запуска (недоступное ядро, KeyboardInterrupt,
+    # некорректная строка вывода) останавливает бинарник: иначе он
+    # продолжил бы работать, с --stable — в SCHED_FIFO
+    try:
+        if core is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(proc.pid, {core})
+        if stable:
+            _stabilize_env(proc.pid)
+        watchdog.start()
+
+        with proc.stdout:
+            while count < iterations:
+                block = b"".join(islice(proc.stdout, _READ_BLOCK_LINES))
+                if not block:
+                    break
+                if not confirmed and count == 0:
+                    confirmed = _CACHE_BUST_BANNER in block
+                values = _NS_LINE_RE.findall(block)[:iterations - count]
+                if not values:
+                    continue
+                block_ns = measurements_ns[count:count + len(values)]
+                block_ns[:] = values
+                count += len(values)
+                lo = min(lo, int(block_ns.min()))
+                hi = max(hi, int(block_ns.max()))
+                total += int(block_ns.sum())
+                if verbose:
+                    print(f"\r  Основные измерения ({count}/{iterations})...",
+                          end='', flush=True)
+
+                if checkpoints and count >= checkpoints[0]:
+                    while checkpoints and count >= checkpoints[0]:
+                        checkpoints.pop(0)
+                    relative_range = (hi - lo) * count / total if total else 0.0
+                    if (relative_range >= RELATIVE_RANGE_LIMIT and relative_range
+                            >= _range_limits(measurements_ns[None, :count])[0]):
+                        unstable = True
+                        break
+
+            if unstable:
+                proc.kill()
+            else:
+                # Остаток вывода (итоговые строки) дочитывается, чтобы
+                # бинарник не получил SIGPIPE
+                proc.stdout.read()
+        proc.wait()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        proc.stdout.close()
+        raise
+    finally:
+        watchdog.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(binary_path, BENCHMARK_TIMEOUT)
+    if not confirmed:
+        raise RuntimeError(f"{binary_path}: бинарник не подтвердил режим "
+                           f"--cache-bust (нет строки "
+                           f"{_CACHE_BUST_BANNER.decode()!r})")
+    if unstable:
+        if verbose:
+            print(" ✗")
+        print(f"  ВНИМАНИЕ: {binary_path}: нестабильная конфигурация "
+              f"(R = {100*relative_range:.1f}% после {count} замеров), "
+              f"измерения прерваны")
+        return measurements_ns[:count] * 1e-3, True
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, binary_path)
+    if count < iterations:
+        raise RuntimeError(f"{binary_path}: получено {count} "
+                           f"замеров из {iterations}")
+
+    if verbose:
+        print(" ✓")
+    return measurements_ns * 1e-3, False
+
+
+def _parse_cpu_list(text: str) -> List[int]:
+    """Разбор списка CPU в формате sysfs: "0-3,8" -> [0, 1, 2, 3, 8]"""
+    cpus = []
+    for part in text.strip().split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        elif part:
+            cpus.append(int(part))
+    return cpus
+
+
+def _thread_siblings(cpu: int) -> List[int]:
+    """
+    Логические CPU того же физического ядра (SMT), включая cpu
+    Без sysfs (не Linux) каждый CPU считается отдельным ядром
+    """
+    path = f"{_CPU_SYSFS}/cpu{cpu}/topology/thread_siblings_list"
+    try:
+        with open(path) as f:
+            return _parse_cpu_list(f.read())
+    except (OSError, ValueError):
+        return [cpu]
+
+
+def _benchmark_cores(available: List[int]) -> List[int]:
+    """
+    Ядра для бенчмарков по умолчанию: по одному логическому CPU на
+    физическое ядро, кроме ядра первого доступного CPU и его SMT-соседей
+    (прерывания и воркеры). На машине с одним физическим ядром — оно само
+    """
+    reserved = set(_thread_siblings(available[0]))
+    cores = []
+    taken = set(reserved)
+    for cpu in available:
+        if cpu not in taken:
+            cores.append(cpu)
+            taken.update(_thread_siblings(cpu))
+    return cores or available[:1]
+
+
+# Ядро для бинарников текущего воркера (задается _pin_worker)
+_worker_core: Optional[int] = None
+
+
+def _pin_worker(cores: "multiprocessing.Queue", reader_cores: List[int]):
+    """
+    Инициализатор воркера: получение ядра для бинарников и закрепление
+    самого воркера (чтение pipe, watchdog) за ядрами вне бенчмарка
+    """
+    global _worker_core
+    _worker_core = cores.get()
+    if reader_cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, reader_cores)
+
+
+def _run_config(name: str, binary_path: str, iterations: int, warmup: int,
+                cache_bust: bool, stable: bool) -> Tuple[str, np.ndarray, bool]:
+    """Задача воркера: одна конфигурация, бинарник на ядре воркера"""
+    measurements, aborted = run_benchmark(binary_path, iterations, warmup,
+                                          cache_bust=cache_bust, stable=stable,
+                                          core=_worker_core, verbose=False)
+    print(f"  {'✗' if aborted else '✓'} {name}: {len(measurements)} замеров")
+    return name, measurements, aborted
+
+
+def run_configurations(configurations: Dict[str, str], iterations: int = 1000,
+                       warmup: int = 100, cores: Optional[List[int]] = None,
+                       cache_bust: bool = False, stable: bool = False) -> Experiment:
+    """
+    Параллельный запуск конфигураций, каждая на своем ядре
+
+    Каждый воркер ProcessPoolExecutor при старте получает одно ядро из
+    cores и закрепляет за ним только запускаемый бинарник
+    (sched_setaffinity(proc.pid)), поэтому две конфигурации никогда не
+    делят ядро. Сами воркеры (чтение pipe, разбор строк, watchdog)
+    работают на остальных доступных ядрах и не вытесняют измеряемый код.
+    Бинарник бенчмарка должен быть однопоточным. По умолчанию под
+    бенчмарки отводится по одному логическому CPU на физическое ядро (по
+    thread_siblings_list), кроме ядра 0 и его SMT-соседей: на нем обычно
+    обрабатываются прерывания и работают воркеры. SMT-соседи ядер
+    бенчмарков воркерам не отдаются. Для минимального шума следует
+    передать ядра, изолированные через isolcpus.
+
+    cache_bust: page cache сбрасывается один раз до старта пула, чтобы
+    sync не попадал в замеры уже работающих конфигураций.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available = sorted(os.sched_getaffinity(0))
+    else:
+        available = list(range(os.cpu_count() or 1))
+    if cores is None:
+        cores = _benchmark_cores(available)
+
+    workers = min(len(configurations), len(cores))
+    core_queue = multiprocessing.Queue()
+    for core in cores[:workers]:
+        core_queue.put(core)
+
+    # Физические ядра бенчмарков целиком: их SMT-соседи не заняты никем
+    busy = set()
+    for core in cores[:workers]:
+        siblings = set(_thread_siblings(core))
+        if siblings & busy:
+            print(f"  ВНИМАНИЕ: ядро {core} делит физическое ядро "
+                  f"с другой конфигурацией (SMT)")
+        busy.update(siblings)
+
+    # Без свободных ядер (одноядерная машина) воркеры не закрепляются
+    reader_cores = [core for core in available if core not in busy]
+
+    print(f"  Параллельный запуск: {len(configurations)} конфигураций "
+          f"на ядрах {cores[:workers]}")
+
+    if cache_bust:
+        drop_page_cache()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker,
+                             initargs=(core_queue, reader_cores)) as executor:
+        futures = [executor.submit(_run_config, name, binary, iterations,
+                                   warmup, cache_bust, stable)
+                   for name, binary in configurations.items()]
+        results = [f.result() for f in futures]
+
+    measurements = {name: m for name, m, _ in results}
+    aborted = {name: flag for name, _, flag in results}
+    return Experiment.from_measurements(measurements, aborted)
 
 
 def compute_speedup(baseline: BenchmarkResult,
@@ -134,8 +799,8 @@ def compute_speedup(baseline: BenchmarkResult,
     s = baseline.mean / optimized.mean
 
     # Относительные погрешности
-    rel_err_base = baseline.stdev / (baseline.mean * math.sqrt(len(baseline.measurements)))
-    rel_err_opt = optimized.stdev / (optimized.mean * math.sqrt(len(optimized.measurements)))
+    rel_err_base = baseline.stdev / (baseline.mean * math.sqrt(baseline.n))
+    rel_err_opt = optimized.stdev / (optimized.mean * math.sqrt(optimized.n))
 
     # Абсолютная погрешность speedup
     delta_s = s * math.sqrt(rel_err_base**2 + rel_err_opt**2)
@@ -143,120 +808,237 @@ def compute_speedup(baseline: BenchmarkResult,
     return s, delta_s
 
 
-def t_test(sample1: BenchmarkResult, sample2: BenchmarkResult) -> Tuple[float, float]:
+def t_test(results: Dict[str, BenchmarkResult]) -> Tuple[np.ndarray, np.ndarray]:
     """
-    t-тест Стьюдента для двух независимых выборок
+    Попарный t-тест Уэлча для всех конфигураций сразу
     H0: средние равны
     H1: средние различны
 
-    Возвращает: (t-статистика, p-value)
+    Статистики считаются в замкнутой форме по векторам средних,
+    дисперсий и объемов выборок, без вызова scipy для каждой пары.
+    При df >= 30 p-value берется из нормального приближения через erfc;
+    scipy импортируется только для малых выборок. Приближение занижает
+    p-value, тем сильнее, чем больше |t| и меньше df: при N ≈ 1000 на
+    пороге 0.05 ошибка ~0.3%, но в хвосте (p ~ 1e-6) ~10% (1.25e-6 против
+    1.41e-6 по Уэлчу), при df ≈ 30 на пороге 0.05 — ~17%. Для решения
+    p < 0.05 при N ≈ 1000 этого достаточно; сами малые p-value следует
+    читать как порядок величины.
+
+    Возвращает: (t-статистики, p-value) — матрицы (k, k) в порядке results;
+    элемент [i, j] соответствует сравнению i-й конфигурации с j-й
     """
-    t_stat, p_value = stats.ttest_ind(sample1.measurements,
-                                      sample2.measurements)
+    samples = list(results.values())
+    means = np.array([r.mean for r in samples])
+    n = np.array([r.n for r in samples], dtype=np.float64)
+    se2 = np.array([r.stdev for r in samples])**2 / n  # s²/n
+
+    se2_sum = se2[:, None] + se2[None, :]
+    se2_frac = se2**2 / (n - 1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = (means[:, None] - means[None, :]) / np.sqrt(se2_sum)
+        # Степени свободы по Уэлчу-Саттертуэйту
+        df = se2_sum**2 / (se2_frac[:, None] + se2_frac[None, :])
+
+    if _HAS_SCIPY and np.any(df < _NORMAL_APPROX_N):
+        from scipy.stats import t as student_t
+        p_value = 2 * student_t.sf(np.abs(t_stat), df)
+    else:
+        # 2 * (1 - Φ(|t|)) = erfc(|t| / √2)
+        p_value = _erfc(np.abs(t_stat) / math.sqrt(2))
     return t_stat, p_value
 
 
-def print_results_table(results: Dict[str, BenchmarkResult]):
+def print_results_table(results: Dict[str, BenchmarkResult],
+                        cache_bust: bool = False):
     """Вывод таблицы результатов"""
-    print("\n" + "="*80)
-    print("РЕЗУЛЬТАТЫ ИЗМЕРЕНИЙ")
-    print("="*80)
-    print(f"{'Конфигурация':<20} {'Mean (μs)':<12} {'Std (μs)':<12} "
-          f"{'95% ДИ':<25} {'CV (%)':<10}")
-    print("-"*80)
+    out = []
+    out.append("\n" + "="*80)
+    out.append("РЕЗУЛЬТАТЫ ИЗМЕРЕНИЙ")
+    if cache_bust:
+        out.append("Режим: cache-bust (холодный кэш данных)")
+    out.append("="*80)
+    out.append(f"{'Конфигурация':<20} {'Mean (μs)':<12} {'Std (μs)':<12} "
+               f"{'95% ДИ':<25} {'CV (%)':<10}")
+    out.append("-"*80)
 
     for name, result in results.items():
         ci_low, ci_high = result.confidence_interval()
-        print(f"{name:<20} {result.mean:>10.2f}  {result.stdev:>10.2f}  "
-              f"[{ci_low:>6.2f}, {ci_high:>6.2f}]        {result.cv:>8.2f}")
+        out.append(f"{name:<20} {result.mean:>10.2f}  {result.stdev:>10.2f}  "
+                   f"[{ci_low:>6.2f}, {ci_high:>6.2f}]        {result.cv:>8.2f}")
 
-    print("="*80)
+    out.append("="*80)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_speedup_analysis(baseline: BenchmarkResult,
-                          optimized: BenchmarkResult):
-    """Анализ ускорения"""
+                          optimized: BenchmarkResult,
+                          t_stat: float, p_value: float):
+    """Анализ ускорения (t_stat, p_value — из t_test для этой пары)"""
     s, delta_s = compute_speedup(baseline, optimized)
     ci_low = s - 1.96 * delta_s
     ci_high = s + 1.96 * delta_s
 
-    print("\n" + "="*80)
-    print("АНАЛИЗ УСКОРЕНИЯ")
-    print("="*80)
-    print(f"Baseline:     {baseline.name}")
-    print(f"  Mean: {baseline.mean:.2f} μs")
-    print(f"Optimized:    {optimized.name}")
-    print(f"  Mean: {optimized.mean:.2f} μs")
-    print(f"\nSpeedup: {s:.2f}× ± {delta_s:.2f}")
-    print(f"95% ДИ: [{ci_low:.2f}, {ci_high:.2f}]")
-    print(f"Относительное улучшение: {100*(s-1):.1f}%")
+    out = []
+    out.append("\n" + "="*80)
+    out.append("АНАЛИЗ УСКОРЕНИЯ")
+    out.append("="*80)
+    out.append(f"Baseline:     {baseline.name}")
+    out.append(f"  Mean: {baseline.mean:.2f} μs")
+    out.append(f"Optimized:    {optimized.name}")
+    out.append(f"  Mean: {optimized.mean:.2f} μs")
+
+    # Для нестабильной конфигурации speedup и t-тест не имеют смысла
+    unstable = [r.name for r in (baseline, optimized) if not r.stable]
+    if unstable:
+        out.append(f"\n✗ Нестабильная конфигурация (R выше порога): "
+                   f"{', '.join(unstable)}")
+        out.append("  Анализ ускорения пропущен, требуется повторный эксперимент")
+        out.append("="*80)
+        sys.stdout.write("\n".join(out) + "\n")
+        return
+
+    out.append(f"\nSpeedup: {s:.2f}× ± {delta_s:.2f}")
+    out.append(f"95% ДИ: [{ci_low:.2f}, {ci_high:.2f}]")
+    out.append(f"Относительное улучшение: {100*(s-1):.1f}%")
 
     # Статистическая значимость
-    t_stat, p_value = t_test(baseline, optimized)
-    print(f"\nt-статистика: {t_stat:.3f}")
-    print(f"p-value: {p_value:.6f}")
+    out.append(f"\nt-статистика: {t_stat:.3f}")
+    out.append(f"p-value: {p_value:.6f}")
 
     if p_value < 0.05:
-        print("✓ Различие статистически значимо (p < 0.05)")
+        out.append("✓ Различие статистически значимо (p < 0.05)")
     else:
-        print("✗ Различие статистически незначимо (p ≥ 0.05)")
+        out.append("✗ Различие статистически незначимо (p ≥ 0.05)")
 
-    print("="*80)
+    out.append("="*80)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def validate_experiment(results: Dict[str, BenchmarkResult]) -> bool:
+def validate_experiment(results: Dict[str, BenchmarkResult],
+                        cache_bust: bool = False) -> bool:
     """
     Проверка критериев валидности эксперимента
+    cache_bust: в режиме холодного кэша разброс выше, порог CV ослаблен
+    (режим подтвержден каждым бинарником, см. run_benchmark)
     """
-    print("\n" + "="*80)
-    print("ПРОВЕРКА КРИТЕРИЕВ ВАЛИДНОСТИ")
-    print("="*80)
+    out = []
+    out.append("\n" + "="*80)
+    out.append("ПРОВЕРКА КРИТЕРИЕВ ВАЛИДНОСТИ")
+    out.append("="*80)
 
     all_valid = True
 
-    # Критерий 7.1: CV < 10%
-    print("\nКритерий 7.1: Стабильность измерений (CV < 10%)")
+    # Критерий 7.1: CV < 10% (< 20% в режиме cache-bust)
+    cv_limit = CV_LIMIT_CACHE_BUST if cache_bust else CV_LIMIT
+    out.append(f"\nКритерий 7.1: Стабильность измерений (CV < {cv_limit:.0f}%)")
     for name, result in results.items():
-        status = "✓" if result.cv < 10.0 else "✗"
-        print(f"  {status} {name}: CV = {result.cv:.2f}%")
-        if result.cv >= 10.0:
+        status = "✓" if result.cv < cv_limit else "✗"
+        out.append(f"  {status} {name}: CV = {result.cv:.2f}%")
+        if result.cv >= cv_limit:
             all_valid = False
 
     # Критерий 7.2: Относительная погрешность < 1%
-    print("\nКритерий 7.2: Точность среднего (δ < 1%)")
+    out.append("\nКритерий 7.2: Точность среднего (δ < 1%)")
     for name, result in results.items():
-        n = len(result.measurements)
-        relative_error = 100 * 1.96 * result.stdev / (math.sqrt(n) * result.mean)
+        relative_error = result.relative_error
         status = "✓" if relative_error < 1.0 else "✗"
-        print(f"  {status} {name}: δ = {relative_error:.3f}%")
+        out.append(f"  {status} {name}: δ = {relative_error:.3f}%")
         if relative_error >= 1.0:
             all_valid = False
 
-    print("\n" + "="*80)
+    # Критерий 7.5: Относительный размах исходных данных < max(30%, 9σ)
+    out.append("\nКритерий 7.5: Отсутствие нестабильности "
+               "((max-min)/mean < max(30%, 9σ), до фильтрации)")
+    for name, result in results.items():
+        status = "✓" if result.stable else "✗"
+        out.append(f"  {status} {name}: R = {100 * result.relative_range:.2f}% "
+                   f"(порог {100 * result.range_limit:.1f}%)"
+                   + (", измерения прерваны" if result.aborted else ""))
+        if not result.stable:
+            all_valid = False
+
+    out.append("\n" + "="*80)
     if all_valid:
-        print("✓ Все критерии валидности выполнены")
+        out.append("✓ Все критерии валидности выполнены")
     else:
-        print("✗ Некоторые критерии валидности не выполнены")
-        print("  Рекомендуется увеличить N или улучшить условия эксперимента")
-    print("="*80)
+        out.append("✗ Некоторые критерии валидности не выполнены")
+        out.append("  Рекомендуется увеличить N или улучшить условия эксперимента")
+    out.append("="*80)
+    sys.stdout.write("\n".join(out) + "\n")
 
     return all_valid
 
 
 def export_to_csv(results: Dict[str, BenchmarkResult], filename: str):
     """Экспорт результатов в CSV для дальнейшего анализа"""
-    with open(filename, 'w') as f:
-        f.write("Configuration,Mean_us,Std_us,CI_Low_us,CI_High_us,CV_percent,N\n")
-        for name, result in results.items():
-            ci_low, ci_high = result.confidence_interval()
-            f.write(f"{name},{result.mean:.4f},{result.stdev:.4f},"
-                   f"{ci_low:.4f},{ci_high:.4f},{result.cv:.4f},"
-                   f"{len(result.measurements)}\n")
+    rows = []
+    for name, result in results.items():
+        ci_low, ci_high = result.confidence_interval()
+        rows.append((name, f"{result.mean:.4f}", f"{result.stdev:.4f}",
+                     f"{ci_low:.4f}", f"{ci_high:.4f}", f"{result.cv:.4f}",
+                     result.n))
+
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(["Configuration", "Mean_us", "Std_us", "CI_Low_us",
+                         "CI_High_us", "CV_percent", "N"])
+        writer.writerows(rows)
     print(f"\n✓ Результаты экспортированы в {filename}")
 
 
+def synthetic_experiment(iterations: int,
+                         rng: Optional[np.random.Generator] = None) -> Experiment:
+    """
+    Синтетические данные на основе наших измерений на сервере
+    (режим --demo: проверка методологии без бинарников бенчмарков)
+    rng: генератор случайных чисел, по умолчанию default_rng(42)
+    """
+    # (ключ, название, mean μs, std μs) — по строке буфера на конфигурацию
+    synthetic = [
+        # FAST_V4 Sequential: 2× KeyGen = 67.74 μs
+        ("FAST_V4_2x_Sequential", "FAST_V4 2× Sequential", 67.74, 3.04),
+        # FAST_V4 Batched: ожидаем ~50 μs (S=1.34)
+        ("FAST_V4_2x_Batched", "FAST_V4 2× Batched", 50.50, 2.27),
+        # GOST_FAST Sequential: 2× KeyGen = 127.74 μs
+        ("GOST_FAST_2x_Sequential", "GOST_FAST 2× Sequential", 127.74, 5.74),
+        # GOST_FAST Batched: ожидаем ~95 μs (S=1.34)
+        ("GOST_FAST_2x_Batched", "GOST_FAST 2× Batched", 95.30, 4.28),
+    ]
+    keys, names, mu, sigma = zip(*synthetic)
+
+    # Весь эксперимент — один буфер (k, N), строки заполняются одним вызовом
+    if rng is None:
+        rng = np.random.default_rng(42)
+    data = rng.normal(np.array(mu)[:, None], np.array(sigma)[:, None],
+                      (len(synthetic), iterations))
+    return Experiment(keys, names, data)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Разбор параметров командной строки"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--demo", action="store_true",
+                        help="синтетические данные вместо запуска бенчмарков")
+    parser.add_argument("--stable", action="store_true",
+                        help="зафиксировать частоту CPU и запускать бенчмарки "
+                             "с SCHED_FIFO (нужен root/sudo)")
+    parser.add_argument("--cores", type=lambda s: [int(c) for c in s.split(",")],
+                        help="ядра для конфигураций через запятую, "
+                             "например изолированные isolcpus: 2,4,6,8")
+    parser.add_argument("--cache-bust", action="store_true",
+                        help="измерение с холодным кэшем данных")
+    return parser.parse_args(argv)
+
+
 def main():
     """Главная функция эксперимента"""
+    args = parse_args()
+
+    # В режиме --demo нечего вытеснять из кэша: флаг не меняет ни данные,
+    # ни пороги критериев
+    cache_bust = args.cache_bust and not args.demo
+
     print("="*80)
     print("СТРОГОЕ БЕНЧМАРКИРОВАНИЕ SABER")
     print("Методология: EXPERIMENTAL_METHODOLOGY.md")
@@ -266,72 +1048,63 @@ def main():
     ITERATIONS = 1000  # Определение 2.1
     WARMUP = 100
 
-    # Примечание: В реальном эксперименте здесь будут пути к бинарным файлам
-    # Для демонстрации используем заглушки
-
+    # Бинарники бенчмарков (собираются отдельно, см. протокол в run_benchmark)
     configurations = {
-        "FAST_V4_Sequential": "./benchmark_fast_v4_seq",
-        "FAST_V4_Batched": "./benchmark_fast_v4_batch",
-        "GOST_FAST_Sequential": "./benchmark_gost_fast_seq",
-        "GOST_FAST_Batched": "./benchmark_gost_fast_batch",
+        "FAST_V4_2x_Sequential": "./benchmark_fast_v4_seq",
+        "FAST_V4_2x_Batched": "./benchmark_fast_v4_batch",
+        "GOST_FAST_2x_Sequential": "./benchmark_gost_fast_seq",
+        "GOST_FAST_2x_Batched": "./benchmark_gost_fast_batch",
     }
 
-    results = {}
-
-    # Для демонстрации создадим синтетические данные
-    # В реальности здесь был бы вызов run_benchmark()
-
-    print("\nГенерация тестовых данных (в реальности - запуск бенчмарков)...\n")
-
-    # Синтетические данные на основе наших измерений на сервере
-    np.random.seed(42)
-
-    # FAST_V4 Sequential: 2× KeyGen = 67.74 μs
-    results["FAST_V4_2x_Sequential"] = BenchmarkResult(
-        name="FAST_V4 2× Sequential",
-        measurements=np.random.normal(67.74, 3.04, ITERATIONS).tolist()
-    )
-
-    # FAST_V4 Batched: ожидаем ~50 μs (S=1.34)
-    results["FAST_V4_2x_Batched"] = BenchmarkResult(
-        name="FAST_V4 2× Batched",
-        measurements=np.random.normal(50.50, 2.27, ITERATIONS).tolist()
-    )
-
-    # GOST_FAST Sequential: 2× KeyGen = 127.74 μs
-    results["GOST_FAST_2x_Sequential"] = BenchmarkResult(
-        name="GOST_FAST 2× Sequential",
-        measurements=np.random.normal(127.74, 5.74, ITERATIONS).tolist()
-    )
-
-    # GOST_FAST Batched: ожидаем ~95 μs (S=1.34)
-    results["GOST_FAST_2x_Batched"] = BenchmarkResult(
-        name="GOST_FAST 2× Batched",
-        measurements=np.random.normal(95.30, 4.28, ITERATIONS).tolist()
-    )
-
-    # Удаление выбросов (метод 3σ)
-    print("Обработка выбросов (метод 3σ)...")
-    for name in list(results.keys()):
-        results[name] = results[name].remove_outliers(threshold=3.0)
+    if args.demo:
+        if args.cache_bust:
+            print("\nВНИМАНИЕ: --cache-bust игнорируется в режиме --demo")
+        print("\nГенерация тестовых данных (режим --demo)...\n")
+        experiment = synthetic_experiment(ITERATIONS)
+    else:
+        missing = [b for b in configurations.values() if not os.path.isfile(b)]
+        if missing:
+            print(f"\nОшибка: Не найдены бинарники бенчмарков: {', '.join(missing)}")
+            print("Для демонстрации на синтетических данных: --demo")
+            sys.exit(1)
+
+        print("\nЗапуск бенчмарков...\n")
+        with locked_cpu_frequency() if args.stable else nullcontext():
+            experiment = run_configurations(configurations, ITERATIONS, WARMUP,
+                                            cores=args.cores,
+                                            cache_bust=cache_bust,
+                                            stable=args.stable)
+
+    # Удаление выбросов (метод MAD)
+    print("Обработка выбросов (метод MAD)...")
+    experiment = experiment.remove_outliers(threshold=3.0)
+    results = experiment.results()
 
     # Вывод результатов
-    print_results_table(results)
+    print_results_table(results, cache_bust=cache_bust)
+
+    # Статистическая значимость для всех пар конфигураций разом
+    t_stats, p_values = t_test(results)
+    index = {name: i for i, name in enumerate(results)}
 
     # Анализ FAST_V4
+    i, j = index["FAST_V4_2x_Sequential"], index["FAST_V4_2x_Batched"]
     print_speedup_analysis(
         results["FAST_V4_2x_Sequential"],
-        results["FAST_V4_2x_Batched"]
+        results["FAST_V4_2x_Batched"],
+        t_stats[i, j], p_values[i, j]
     )
 
     # Анализ GOST_FAST
+    i, j = index["GOST_FAST_2x_Sequential"], index["GOST_FAST_2x_Batched"]
     print_speedup_analysis(
         results["GOST_FAST_2x_Sequential"],
-        results["GOST_FAST_2x_Batched"]
+        results["GOST_FAST_2x_Batched"],
+        t_stats[i, j], p_values[i, j]
     )
 
     # Проверка валидности
-    validate_experiment(results)
+    validate_experiment(results, cache_bust=cache_bust)
 
     # Экспорт в CSV
     export_to_csv(results, "benchmark_results.csv")
@@ -342,13 +1115,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Проверка зависимостей
-    try:
-        import scipy
-        import numpy
-    except ImportError:
-        print("Ошибка: Требуются библиотеки scipy и numpy")
-        print("Установка: pip3 install scipy numpy")
-        sys.exit(1)
-
     main()
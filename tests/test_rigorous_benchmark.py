@@ -0,0 +1,252 @@
+"""
+Тесты scripts/rigorous_benchmark.py: ранняя отбраковка нестабильных
+конфигураций и Критерий 7.5 (запуск: python -m unittest discover tests)
+"""
+
+import contextlib
+import io
+import os
+import stat
+import sys
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import rigorous_benchmark as rb  # noqa: E402
+
+# Фиктивный бенчмарк: argv = [binary, warmup, iterations, (--cache-bust)],
+# на замер — строка с целым числом наносекунд (~68 μs, CV 4.5%), замер
+# SPIKE — 120 μs; при CONFIRM режим --cache-bust подтверждается баннером
+_FAKE_BINARY = """#!{python}
+import random, sys
+random.seed(1)
+iterations = int(sys.argv[2])
+print("# fake benchmark")
+if {confirm} and "--cache-bust" in sys.argv:
+    print("# mode: cache-bust")
+for i in range(iterations):
+    ns = 120000 if i == {spike} else int(random.gauss(68000, 3060))
+    print(ns, flush=True)
+"""
+
+
+class UnstableConfigurationTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _binary(self, spike: int, confirm: bool = True) -> str:
+        path = os.path.join(self._tmp.name, f"bench_{spike}_{confirm}")
+        with open(path, "w") as f:
+            f.write(_FAKE_BINARY.format(python=sys.executable, spike=spike,
+                                        confirm=confirm))
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        return path
+
+    def test_spike_aborts_and_stays_unstable_after_filtering(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            measurements, aborted = rb.run_benchmark(self._binary(spike=150),
+                                                     1000, 0, verbose=False)
+        self.assertTrue(aborted)
+        self.assertLess(len(measurements), 1000)
+
+        experiment = rb.Experiment.from_measurements({"spike": measurements},
+                                                     {"spike": aborted})
+        result = experiment.remove_outliers(3.0).results()["spike"]
+        self.assertLess(result.n, len(measurements))
+        self.assertTrue(result.aborted)
+        self.assertFalse(result.stable)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(rb.validate_experiment({"spike": result}))
+
+    def test_run_configurations_keeps_aborted_flag(self):
+        configurations = {"spike": self._binary(spike=150),
+                          "clean": self._binary(spike=-1)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            experiment = rb.run_configurations(configurations, 1000, 0,
+                                               cores=[0])
+        results = experiment.remove_outliers(3.0).results()
+        self.assertFalse(results["spike"].stable)
+        self.assertTrue(results["clean"].stable)
+
+    def test_child_is_killed_on_error(self):
+        path = os.path.join(self._tmp.name, "bench_overflow")
+        with open(path, "w") as f:
+            f.write(f"#!{sys.executable}\n"
+                    "import time\n"
+                    "print('9' * 30)\n"
+                    "print('1000\\n' * 200, flush=True)\n"
+                    "time.sleep(60)\n")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+
+        for kwargs in ({"core": 1 << 20}, {}):
+            with self.assertRaises((OSError, OverflowError)):
+                rb.run_benchmark(path, 1000, 0, verbose=False, **kwargs)
+            # Бинарник остановлен и дождан: дочерних процессов не осталось
+            with self.assertRaises(ChildProcessError):
+                os.waitpid(-1, os.WNOHANG)
+
+    def test_cache_bust_requires_confirmation(self):
+        measurements, _ = rb.run_benchmark(self._binary(spike=-1), 300, 0,
+                                           cache_bust=True, verbose=False)
+        self.assertEqual(len(measurements), 300)
+
+        with self.assertRaisesRegex(RuntimeError, "cache-bust"):
+            rb.run_benchmark(self._binary(spike=-1, confirm=False), 300, 0,
+                             cache_bust=True, verbose=False)
+
+    def test_clean_run_is_not_aborted(self):
+        measurements, aborted = rb.run_benchmark(self._binary(spike=-1),
+                                                 1000, 0, verbose=False)
+        self.assertFalse(aborted)
+        self.assertEqual(len(measurements), 1000)
+        result = rb.Experiment.from_measurements({"clean": measurements}).results()["clean"]
+        self.assertTrue(result.stable)
+
+    def test_relative_range_is_computed_before_filtering(self):
+        data = np.random.default_rng(0).normal(68.0, 3.06, 1000)
+        data[900] = 120.0  # после последней контрольной точки
+        experiment = rb.Experiment.from_measurements({"late": data})
+        result = experiment.remove_outliers(3.0).results()["late"]
+        self.assertEqual(result.relative_range, experiment.relative_ranges[0])
+        self.assertGreater(result.relative_range, result.range_limit)
+        self.assertFalse(result.stable)
+
+    def test_clean_gaussian_passes_range_limit(self):
+        rng = np.random.default_rng(0)
+        data = rng.normal(68.0, 3.06, (200, 1000))
+        experiment = rb.Experiment(list(range(200)), list(range(200)), data)
+        unstable = experiment.relative_ranges >= experiment.range_limits
+        self.assertLessEqual(unstable.sum(), 2)
+
+
+
+class RemoveOutliersTest(unittest.TestCase):
+
+    def _filter(self, measurements):
+        experiment = rb.Experiment.from_measurements(measurements)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            filtered = experiment.remove_outliers(3.0)
+        return filtered, out.getvalue()
+
+    def test_mad_rule(self):
+        # median = 100, MAD = 0.5: порог 3 · 1.4826 · 0.5 ≈ 2.22
+        base = 100.0 + np.linspace(-1.0, 1.0, 101)
+        filtered, out = self._filter({"a": np.append(base, [102.0, 102.5, 200.0])})
+        kept = filtered.results()["a"].measurements
+        np.testing.assert_array_equal(kept, np.append(base, 102.0))
+        self.assertEqual(filtered.names, ["a (filtered)"])
+        self.assertEqual(out, "")
+
+    def test_rows_of_different_length(self):
+        filtered, _ = self._filter({"short": np.array([1.0, 1.1, 0.9, 50.0]),
+                                    "long": 100.0 + np.linspace(-1.0, 1.0, 101)})
+        results = filtered.results()
+        self.assertEqual(results["short"].n, 3)
+        self.assertEqual(results["long"].n, 101)
+
+    def test_zero_mad_keeps_everything(self):
+        data = np.append(np.full(60, 5.0), np.linspace(6.0, 1000.0, 40))
+        filtered, out = self._filter({"flat": data})
+        self.assertEqual(filtered.results()["flat"].n, 100)
+        self.assertEqual(out, "")
+
+    def test_warns_when_more_than_5_percent_removed(self):
+        data = np.append(100.0 + np.linspace(-1.0, 1.0, 90), np.full(10, 500.0))
+        filtered, out = self._filter({"noisy": data})
+        self.assertEqual(filtered.results()["noisy"].n, 90)
+        self.assertIn("Удалено 10.0% измерений для noisy", out)
+
+
+class SweepKernelTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.data = rng.normal(68.0, 3.0, (6, 200))
+        self.data[1, 150:] = np.nan        # короткая серия
+        self.data[2, ::7] = np.nan         # отфильтрованные замеры
+        self.data[3, 1:] = np.nan          # один замер
+        self.data[4, :] = np.nan           # пустая строка
+        self.data[5, :] = -1.0             # mean <= 0
+
+    def _assert_matches_numpy(self, kernel):
+        # Пустые и одиночные строки: предупреждения numpy ожидаемы
+        with warnings.catch_warnings(), np.errstate(invalid='ignore'):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            expected = rb._sweep_numpy(self.data)
+            actual = kernel(self.data)
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            np.testing.assert_allclose(a, e, rtol=1e-12, equal_nan=True)
+
+    def test_loops_match_numpy(self):
+        self._assert_matches_numpy(rb._sweep_loops)
+
+    @unittest.skipUnless(rb._HAS_NUMBA, "нужен numba")
+    def test_jit_matches_numpy(self):
+        self._assert_matches_numpy(rb._sweep_jit())
+
+
+class BenchmarkCoresTest(unittest.TestCase):
+
+    def _cores(self, siblings, available):
+        with mock.patch.object(rb, "_thread_siblings", lambda cpu: siblings[cpu]):
+            return rb._benchmark_cores(available)
+
+    def test_one_cpu_per_physical_core_without_core0(self):
+        # Нумерация Intel: SMT-соседи — cpu и cpu + 4
+        siblings = {cpu: [cpu % 4, cpu % 4 + 4] for cpu in range(8)}
+        self.assertEqual(self._cores(siblings, list(range(8))), [1, 2, 3])
+
+        # Нумерация AMD/ARM: SMT-соседи — соседние номера
+        siblings = {cpu: [cpu // 2 * 2, cpu // 2 * 2 + 1] for cpu in range(8)}
+        self.assertEqual(self._cores(siblings, list(range(8))), [2, 4, 6])
+
+    def test_single_core_machine(self):
+        self.assertEqual(self._cores({0: [0]}, [0]), [0])
+
+    def test_parse_cpu_list(self):
+        self.assertEqual(rb._parse_cpu_list("0-3,8\n"), [0, 1, 2, 3, 8])
+
+
+
+@unittest.skipUnless(rb._HAS_SCIPY, "нужен scipy")
+class WelchTTestTest(unittest.TestCase):
+
+    def _check(self, n, scale, p_rtol):
+        from scipy.stats import ttest_ind
+
+        rng = np.random.default_rng(3)
+        data = {f"c{i}": rng.normal(68.0 + scale * i, 3.0 + i, n) for i in range(3)}
+        results = rb.Experiment.from_measurements(data).results()
+        t_stats, p_values = rb.t_test(results)
+
+        self.assertEqual(t_stats.shape, (3, 3))
+        np.testing.assert_array_equal(np.diag(t_stats), 0.0)
+        np.testing.assert_allclose(t_stats, -t_stats.T)
+        for i, a in enumerate(data.values()):
+            for j, b in enumerate(data.values()):
+                if i == j:
+                    continue
+                expected = ttest_ind(a, b, equal_var=False)
+                self.assertAlmostEqual(t_stats[i, j], expected.statistic, places=10)
+                np.testing.assert_allclose(p_values[i, j], expected.pvalue, rtol=p_rtol)
+
+    def test_small_samples_use_student(self):
+        # df < 30: точные p-value scipy
+        self._check(n=10, scale=3.0, p_rtol=1e-10)
+
+    def test_large_samples_use_normal_approximation(self):
+        # df >= 30: erfc, при p ~ 0.03..0.3 ошибка < 1% (см. докстринг t_test)
+        self._check(n=1000, scale=0.25, p_rtol=1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()